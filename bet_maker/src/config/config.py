@@ -24,10 +24,13 @@ class Settings(BaseSettings):
     DB_HOST: str = Field("localhost", description="Хост базы данных")
     DB_PORT: Optional[str] = Field(None, description="Порт базы данных")
     DATABASE_URL: Optional[str] = None
-    DB_POOL_SIZE: int = Field(5, description="Размер пула соединений", ge=1, le=20)
+    # Один процесс держит до DB_POOL_SIZE + DB_MAX_OVERFLOW соединений; API и поллер
+    # вместе не должны выходить за max_connections PostgreSQL (по умолчанию 100)
+    DB_POOL_SIZE: int = Field(20, description="Размер пула соединений", ge=1, le=50)
     DB_MAX_OVERFLOW: int = Field(10, description="Максимальное количество дополнительных соединений", ge=0, le=50)
     DB_POOL_TIMEOUT: int = Field(30, description="Таймаут пула в секундах", ge=1, le=60)
     DB_POOL_RECYCLE: int = Field(1800, description="Время переиспользования соединения в секундах", ge=1)
+    DB_POOL_USE_LIFO: bool = Field(True, description="Выдавать из пула последнее возвращённое соединение (LIFO)")
     DB_ECHO: bool = Field(False, description="Вывод SQL-запросов для отладки")
 
     # URL внешних сервисов
@@ -102,12 +105,6 @@ class Settings(BaseSettings):
         port = values.get("DB_PORT")
         db = values.get("DB_NAME")
 
-        pool_size = values.get("DB_POOL_SIZE", 5)
-        max_overflow = values.get("DB_MAX_OVERFLOW", 10)
-        pool_timeout = values.get("DB_POOL_TIMEOUT", 30)
-        pool_recycle = values.get("DB_POOL_RECYCLE", 1800)
-        echo = values.get("DB_ECHO", False)
-
         # SQLite file-based
         if driver.startswith("sqlite"):
             url = f"{driver}:///{db}"
@@ -122,22 +119,6 @@ class Settings(BaseSettings):
                 url += f":{port}"
             url += f"/{db}"
 
-        query_params = []
-
-        if not driver.startswith("sqlite"):
-            query_params.extend([
-                f"pool_size={pool_size}",
-                f"max_overflow={max_overflow}",
-                f"pool_timeout={pool_timeout}",
-                f"pool_recycle={pool_recycle}"
-            ])
-
-        if echo:
-            query_params.append("echo=true")
-
-        if query_params:
-            url += "?" + "&".join(query_params)
-
         return url
 
     @field_validator("BACKEND_CORS_ORIGINS")
@@ -7,6 +7,7 @@ from src.domain.vo import BetStatus
 
 
 class BaseBetRepository(ABC):
+    __slots__ = ()
 
     @abstractmethod
     async def get_all(self, limit: int, offset: int, status: str) -> List[Bet]:
@@ -7,6 +7,7 @@ from src.domain.vo import EventStatus
 
 
 class BaseEventRepository(ABC):
+    __slots__ = ()
 
     @abstractmethod
     async def get_all(self) -> List[Event]:
@@ -11,13 +11,16 @@ from sqlalchemy.ext.asyncio import (
 
 from src.config import settings
 
+# LIFO-пул раз за разом выдаёт одно и то же "тёплое" соединение, а лишние простаивают
+# и закрываются по pool_recycle
 engine: AsyncEngine = create_async_engine(
     settings.DATABASE_URL,
-    echo=False,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
     pool_pre_ping=True,
 )
 
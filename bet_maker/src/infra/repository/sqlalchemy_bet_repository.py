@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import List, Union, Optional
+from typing import Any, Dict, List, Union, Optional
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, insert, update, and_, exists, bindparam
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,11 @@ from src.exception import (
 )
 from src.infra.database.bet_model import BetModel
 
+# Точечные запросы по первичному ключу строятся один раз: одинаковый объект запроса
+# попадает в кэш компиляции SQLAlchemy и в кэш подготовленных выражений asyncpg
+GET_BY_ID_STMT = select(BetModel).where(BetModel.bet_id == bindparam("bet_id"))
+EXISTS_STMT = select(exists().where(BetModel.bet_id == bindparam("bet_id")))
+
 
 class SQLAlchemyBetRepository(BaseBetRepository):
 
@@ -70,8 +75,7 @@ class SQLAlchemyBetRepository(BaseBetRepository):
             BetRepositoryConnectionError: При ошибке подключения к базе данных
         """
         try:
-            stmt = select(BetModel).where(BetModel.bet_id == bet_id)
-            result = await self._session.execute(stmt)
+            result = await self._session.execute(GET_BY_ID_STMT, {"bet_id": bet_id})
             bet_model = result.scalar_one_or_none()
 
             if bet_model is None:
@@ -96,11 +100,12 @@ class SQLAlchemyBetRepository(BaseBetRepository):
             BetRepositoryConnectionError: При ошибке подключения к базе данных
         """
         try:
-            bet_model = self._to_db_model(bet)
-
-            self._session.add(bet_model)
+            # INSERT ... RETURNING возвращает строку с присвоенными БД полями сразу,
+            # без отдельного refresh после commit
+            stmt = insert(BetModel).values(**self._to_db_values(bet)).returning(BetModel)
+            result = await self._session.execute(stmt)
+            bet_model = result.scalar_one()
             await self._session.commit()
-            await self._session.refresh(bet_model)
 
             return self._to_domain_entity(bet_model)
         except SQLAlchemyError as e:
@@ -124,7 +129,7 @@ class SQLAlchemyBetRepository(BaseBetRepository):
             BetRepositoryConnectionError: При ошибке подключения к базе данных
         """
         try:
-            stmt = select(BetModel).where(BetModel.event_id == str(event_id))
+            stmt = select(BetModel).where(BetModel.event_id == int(event_id))
             result = await self._session.execute(stmt)
             bet_models = result.scalars().all()
 
@@ -170,23 +175,18 @@ class SQLAlchemyBetRepository(BaseBetRepository):
             BetRepositoryConnectionError: При ошибке подключения к базе данных
         """
         try:
-            exists = await self.exists(bet_id)
-            if not exists:
-                raise BetNotFoundError(f"Ставка с ID {bet_id} не найдена")
-
+            # UPDATE ... RETURNING: отсутствие строки в результате означает, что ставки нет
             stmt = (
                 update(BetModel)
                 .where(BetModel.bet_id == bet_id)
                 .values(status=new_status)
+                .returning(BetModel)
             )
-            await self._session.execute(stmt)
-
-            get_stmt = select(BetModel).where(BetModel.bet_id == bet_id)
-            result = await self._session.execute(get_stmt)
+            result = await self._session.execute(stmt)
             updated_bet = result.scalar_one_or_none()
 
             if updated_bet is None:
-                raise BetNotFoundError(f"Ставка с ID {bet_id} не найдена после обновления")
+                raise BetNotFoundError(f"Ставка с ID {bet_id} не найдена")
 
             await self._session.commit()
 
@@ -248,7 +248,7 @@ class SQLAlchemyBetRepository(BaseBetRepository):
         try:
             filters = []
             if event_id is not None:
-                filters.append(BetModel.event_id == str(event_id))
+                filters.append(BetModel.event_id == int(event_id))
 
             if status is not None:
                 filters.append(BetModel.status == status)
@@ -284,48 +284,57 @@ class SQLAlchemyBetRepository(BaseBetRepository):
             BetRepositoryConnectionError: При ошибке подключения к базе данных
         """
         try:
-            stmt = select(BetModel.bet_id).where(BetModel.bet_id == bet_id)
-            result = await self._session.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            result = await self._session.execute(EXISTS_STMT, {"bet_id": bet_id})
+            return bool(result.scalar())
         except SQLAlchemyError as e:
             raise BetRepositoryConnectionError(f"Не удалось проверить существование ставки: {str(e)}")
 
     async def update_bets(self, bets: List[Bet]) -> List[Bet]:
         """
         Обновление нескольких ставок за одну операцию.
+
+        Ставки с bet_id, которого нет в базе, пропускаются без ошибки.
         
         Args:
             bets: Список сущностей ставок с обновленными значениями
             
         Returns:
-            Список обновленных сущностей ставок
+            Переданный список сущностей ставок
             
         Raises:
-            BetRepositoryConnectionError: При ошибке подключения к базе данных
+            BetRepositoryConnectionError: При ошибке базы данных; транзакция откатывается
         """
-        try:
-            updated_bets = []
-
-            for bet in bets:
-                stmt = (
-                    update(BetModel)
-                    .where(BetModel.bet_id == bet.bet_id)
-                    .values(
-                        event_id=str(bet.event_id),
-                        amount=bet.amount,
-                        status=bet.status
-                    )
-                )
-                await self._session.execute(stmt)
-
-                updated_bets.append(bet)
+        if not bets:
+            return []
 
+        try:
+            # ORM bulk UPDATE по первичному ключу падает с StaleDataError, если хотя бы
+            # одной строки нет, поэтому неизвестные bet_id отсеиваются заранее
+            existing_ids = set(
+                (await self._session.execute(
+                    select(BetModel.bet_id).where(BetModel.bet_id.in_([bet.bet_id for bet in bets]))
+                )).scalars().all()
+            )
+            # Список параметров отправляется одним executemany
+            # вместо отдельного UPDATE на каждую ставку
+            payload: List[Dict[str, Any]] = [
+                {
+                    "bet_id": bet.bet_id,
+                    "event_id": bet.event_id,
+                    "amount": bet.amount,
+                    "status": bet.status
+                }
+                for bet in bets
+                if bet.bet_id in existing_ids
+            ]
+            if payload:
+                await self._session.execute(update(BetModel), payload)
             await self._session.commit()
 
-            return updated_bets
+            return list(bets)
         except SQLAlchemyError as e:
             await self._session.rollback()
-            raise BetRepositoryConnectionError(f"Не удалось обновить ставки: {str(e)}")
+            raise BetRepositoryConnectionError("database", f"Не удалось обновить ставки: {str(e)}")
 
     async def save(self, bet_request: BetRequest) -> BetResponse:
         """
@@ -342,7 +351,7 @@ class SQLAlchemyBetRepository(BaseBetRepository):
         """
         try:
             new_bet_model = BetModel(
-                event_id=str(bet_request.event_id),
+                event_id=bet_request.event_id,
                 amount=bet_request.amount,
                 status=BetStatus.PENDING
             )
@@ -417,26 +426,26 @@ class SQLAlchemyBetRepository(BaseBetRepository):
             created_at=bet_model.created_at
         )
 
-    def _to_db_model(self, bet: Bet) -> BetModel:
+    def _to_db_values(self, bet: Bet) -> Dict[str, Any]:
         """
-        Преобразование доменной сущности в модель базы данных.
+        Преобразование доменной сущности в значения столбцов для INSERT.
         
         Args:
             bet: Доменная сущность для преобразования
             
         Returns:
-            Соответствующая модель базы данных
+            Словарь значений столбцов модели базы данных
         """
-        bet_model = BetModel(
-            event_id=bet.event_id,
-            amount=bet.amount,
-            status=bet.status
-        )
+        values: Dict[str, Any] = {
+            "event_id": bet.event_id,
+            "amount": bet.amount,
+            "status": bet.status
+        }
 
         if hasattr(bet, 'bet_id') and bet.bet_id is not None:
-            bet_model.bet_id = bet.bet_id
+            values["bet_id"] = bet.bet_id
 
         if hasattr(bet, 'created_at') and bet.created_at is not None:
-            bet_model.created_at = bet.created_at
+            values["created_at"] = bet.created_at
 
-        return bet_model
+        return values
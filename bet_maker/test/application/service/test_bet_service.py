@@ -50,7 +50,6 @@ def sample_bets():
 
 
 class TestBetService:
-    @pytest.mark.asyncio
     async def test_get_all_bets(self, bet_service, mock_bet_repo, sample_bets):
         mock_bet_repo.get_all.return_value = sample_bets
         result = await bet_service.get_all_bets()
@@ -58,7 +57,6 @@ class TestBetService:
         assert all(isinstance(bet, BetResponse) for bet in result)
         mock_bet_repo.get_all.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_bet_by_id(self, bet_service, mock_bet_repo, sample_bets):
         bet = sample_bets[0]
         mock_bet_repo.get_by_id.return_value = bet
@@ -67,14 +65,12 @@ class TestBetService:
         assert result.bet_id == bet.bet_id
         mock_bet_repo.get_by_id.assert_called_once_with(1)
 
-    @pytest.mark.asyncio
     async def test_get_bet_by_id_not_found(self, bet_service, mock_bet_repo):
         mock_bet_repo.get_by_id.side_effect = BetNotFoundError(bet_id=999)
         with pytest.raises(BetNotFoundError) as exc_info:
             await bet_service.get_bet_by_id(999)
         assert "999" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_get_bets_by_event(self, bet_service, mock_bet_repo, sample_bets):
         event_bets = [b for b in sample_bets if b.event_id == 1]
         mock_bet_repo.get_by_event_id.return_value = event_bets
@@ -83,7 +79,6 @@ class TestBetService:
         assert all(bet.event_id == 1 for bet in result)
         mock_bet_repo.get_by_event_id.assert_called_once_with(1)
 
-    @pytest.mark.asyncio
     async def test_get_bets_by_status(self, bet_service, mock_bet_repo, sample_bets):
         pending_bets = [b for b in sample_bets if b.status == BetStatus.PENDING]
         mock_bet_repo.get_by_status.return_value = pending_bets
@@ -92,7 +87,6 @@ class TestBetService:
         assert all(bet.status == BetStatus.PENDING for bet in result)
         mock_bet_repo.get_by_status.assert_called_once_with(BetStatus.PENDING)
 
-    @pytest.mark.asyncio
     async def test_create_bet_successful(self, bet_service, mock_event_repo, mock_bet_repo, sample_events):
         event = sample_events[0]
         mock_event_repo.get_by_id.return_value = event
@@ -107,7 +101,6 @@ class TestBetService:
         mock_event_repo.get_by_id.assert_called_once_with(event.event_id)
         mock_bet_repo.create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_bet_event_not_found(self, bet_service, mock_event_repo):
         bet_request = BetRequest(event_id=999, amount=Decimal("25.00"))
         mock_event_repo.get_by_id.side_effect = EventNotFoundError(event_id=999)
@@ -116,7 +109,6 @@ class TestBetService:
         assert "999" in str(exc_info.value)
         mock_event_repo.get_by_id.assert_called_once_with(999)
 
-    @pytest.mark.asyncio
     async def test_create_bet_event_finished(self, bet_service, mock_event_repo, sample_events):
         finished_event = sample_events[1]
         mock_event_repo.get_by_id.return_value = finished_event
@@ -126,7 +118,6 @@ class TestBetService:
         assert "завершено" in str(exc_info.value).lower()
         mock_event_repo.get_by_id.assert_called_once_with(finished_event.event_id)
 
-    @pytest.mark.asyncio
     async def test_create_bet_event_deadline_passed(self, bet_service, mock_event_repo, sample_events):
         past_deadline_event = sample_events[2]
         mock_event_repo.get_by_id.return_value = past_deadline_event
@@ -136,7 +127,6 @@ class TestBetService:
         assert "истек" in str(exc_info.value).lower()
         mock_event_repo.get_by_id.assert_called_once_with(past_deadline_event.event_id)
 
-    @pytest.mark.asyncio
     async def test_update_bets_status_win(self, bet_service, mock_bet_repo, mock_event_repo, sample_bets, sample_events):
         mock_event_repo.get_all.return_value = sample_events
         win_event = sample_events[1]
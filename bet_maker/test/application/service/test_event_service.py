@@ -35,7 +35,6 @@ def sample_events():
 
 
 class TestEventService:
-    @pytest.mark.asyncio
     async def test_get_all(self, event_service, mock_event_repository, sample_events):
         mock_event_repository.get_all.return_value = sample_events
 
@@ -44,7 +43,6 @@ class TestEventService:
         assert result == sample_events
         mock_event_repository.get_all.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_all_with_error(self, event_service, mock_event_repository):
         mock_event_repository.get_all.side_effect = EventRepositoryConnectionError(
             source="test", message="Test connection error"
@@ -53,7 +51,6 @@ class TestEventService:
         with pytest.raises(EventRepositoryConnectionError):
             await event_service.get_all()
 
-    @pytest.mark.asyncio
     async def test_get_active_events(self, event_service, mock_event_repository, sample_events):
         active_events = [sample_events[0]]
         mock_event_repository.get_active_events.return_value = active_events
@@ -63,7 +60,6 @@ class TestEventService:
         assert result == active_events
         mock_event_repository.get_active_events.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_events_by_status(self, event_service, mock_event_repository, sample_events):
         new_events = [e for e in sample_events if e.status == EventStatus.NEW]
         mock_event_repository.filter_events.return_value = new_events
@@ -75,7 +71,6 @@ class TestEventService:
             status=EventStatus.NEW
         )
 
-    @pytest.mark.asyncio
     async def test_get_events_by_deadline(self, event_service, mock_event_repository, sample_events):
         now = datetime.now()
         mock_event_repository.filter_events.return_value = [sample_events[0], sample_events[1]]
@@ -91,7 +86,6 @@ class TestEventService:
             deadline_after=now
         )
 
-    @pytest.mark.asyncio
     async def test_get_event_by_id(self, event_service, mock_event_repository, sample_events):
         event = sample_events[0]
         mock_event_repository.get_by_id.return_value = event
@@ -101,7 +95,6 @@ class TestEventService:
         assert result == event
         mock_event_repository.get_by_id.assert_called_once_with(1)
 
-    @pytest.mark.asyncio
     async def test_get_event_by_id_not_found(self, event_service, mock_event_repository):
         mock_event_repository.get_by_id.side_effect = EventNotFoundError(event_id=999)
 
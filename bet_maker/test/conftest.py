@@ -1,42 +1,118 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import AsyncGenerator, List
+from typing import Any, AsyncGenerator, Callable, Dict, List, Tuple
 
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
 
 from src.domain.entity import Bet
 from src.domain.vo import BetStatus
-from src.infra.database.base_model import Base
-from src.infra.database.bet_model import BetModel
-
-
-# Fixture for in-memory SQLite database
-@pytest_asyncio.fixture(scope="function")
+from src.infra.database import Base, BetModel
+
+D_100_00 = Decimal("100.00")
+D_50_00 = Decimal("50.00")
+D_75_00 = Decimal("75.00")
+D_200_00 = Decimal("200.00")
+
+BET_DEFAULTS: Dict[str, Any] = {
+    "bet_id": 1,
+    "event_id": 101,
+    "amount": D_100_00,
+    "status": BetStatus.PENDING,
+    "created_at": datetime(2023, 1, 1, 12, 0, 0),
+}
+
+SAMPLE_BET_ROWS: Tuple[Dict[str, Any], ...] = (
+    {"bet_id": 1, "event_id": 101, "amount": D_100_00, "status": BetStatus.PENDING, "created_at": datetime(2023, 1, 1, 12, 0, 0)},
+    {"bet_id": 2, "event_id": 102, "amount": D_50_00, "status": BetStatus.WON, "created_at": datetime(2023, 1, 2, 12, 0, 0)},
+    {"bet_id": 3, "event_id": 101, "amount": D_75_00, "status": BetStatus.LOST, "created_at": datetime(2023, 1, 3, 12, 0, 0)},
+    {"bet_id": 4, "event_id": 103, "amount": D_200_00, "status": BetStatus.PENDING, "created_at": datetime(2023, 1, 4, 12, 0, 0)},
+)
+
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_SQLITE_DIALECT = sqlite.dialect()
+
+# DDL схемы компилируется один раз при импорте, а не на каждый запуск create_all/drop_all
+CREATE_SCHEMA_DDL = tuple(
+    str(statement.compile(dialect=_SQLITE_DIALECT)).strip()
+    for table in Base.metadata.sorted_tables
+    for statement in (CreateTable(table), *(CreateIndex(index) for index in table.indexes))
+)
+DROP_SCHEMA_DDL = tuple(
+    str(DropTable(table).compile(dialect=_SQLITE_DIALECT)).strip()
+    for table in reversed(Base.metadata.sorted_tables)
+)
+
+
+def pytest_collection_modifyitems(items):
+    # Все асинхронные тесты выполняются в одном event loop на всю сессию
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+def _disable_driver_transactions(sync_connection) -> None:
+    # pysqlite сам решает, когда выполнять BEGIN, и ломает вложенные SAVEPOINT;
+    # отключаем это поведение и начинаем транзакции явно (см. событие "begin")
+    sync_connection.connection.dbapi_connection.isolation_level = None
+
+
+def _emit_begin(sync_connection) -> None:
+    sync_connection.exec_driver_sql("BEGIN")
+
+
+# Fixture for in-memory SQLite database.
+# Движок и схема создаются один раз на модуль, а не на каждый тест: изоляция тестов
+# обеспечивается в db_session внешней транзакцией, которая откатывается после теста,
+# а commit() внутри репозиториев фиксирует лишь SAVEPOINT. Общий на всю сессию движок
+# не используется намеренно: модуль остаётся границей, за которую не утекает состояние
+# тестов, неаккуратно работающих с собственными транзакциями.
+@pytest_asyncio.fixture(scope="module")
 async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    # Каждое обращение к aiosqlite - переход в рабочий поток, поэтому отключаем ROLLBACK
+    # при возврате соединения в пул: транзакциями явно управляют Connection и db_session
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        pool_reset_on_return=None
+    )
 
-    @event.listens_for(engine.sync_engine, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    # StaticPool держит единственное соединение, поэтому настроить его достаточно один раз
+    async with engine.connect() as conn:
+        await conn.run_sync(_disable_driver_transactions)
+        for pragma in SQLITE_PRAGMAS:
+            await conn.exec_driver_sql(pragma)
+    event.listen(engine.sync_engine, "begin", _emit_begin)
 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        for statement in CREATE_SCHEMA_DDL:
+            await conn.exec_driver_sql(statement)
 
     try:
         yield engine
     finally:
         async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
+            for statement in DROP_SCHEMA_DDL:
+                await conn.exec_driver_sql(statement)
         await engine.dispose()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="module")
 async def async_session_factory(async_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(
         bind=async_engine,
@@ -48,40 +124,45 @@ async def async_session_factory(async_engine: AsyncEngine) -> async_sessionmaker
 
 
 @pytest_asyncio.fixture(scope="function")
-async def db_session(async_session_factory: async_sessionmaker[AsyncSession]) -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_factory() as session:
-        try:
+async def db_session(
+    async_engine: AsyncEngine,
+    async_session_factory: async_sessionmaker[AsyncSession]
+) -> AsyncGenerator[AsyncSession, None]:
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        async with async_session_factory(bind=connection, join_transaction_mode="create_savepoint") as session:
             yield session
-        finally:
-            await session.rollback()
-            await session.close()
+        await transaction.rollback()
 
 
 @pytest.fixture
 def sample_bet_models() -> List[BetModel]:
-    return [
-        BetModel(bet_id=1, event_id=101, amount=Decimal("100.00"), status=BetStatus.PENDING, created_at=datetime(2023, 1, 1, 12, 0, 0)),
-        BetModel(bet_id=2, event_id=102, amount=Decimal("50.00"), status=BetStatus.WON, created_at=datetime(2023, 1, 2, 12, 0, 0)),
-        BetModel(bet_id=3, event_id=101, amount=Decimal("75.00"), status=BetStatus.LOST, created_at=datetime(2023, 1, 3, 12, 0, 0)),
-        BetModel(bet_id=4, event_id=103, amount=Decimal("200.00"), status=BetStatus.PENDING, created_at=datetime(2023, 1, 4, 12, 0, 0)),
-    ]
+    # ORM-объекты привязываются к сессии теста, поэтому создаются заново из общих строк
+    return [BetModel(**row) for row in SAMPLE_BET_ROWS]
 
 
-@pytest.fixture
-def sample_bets() -> List[Bet]:
-    return [
-        Bet(bet_id=1, event_id=101, amount=Decimal("100.00"), status=BetStatus.PENDING, created_at=datetime(2023, 1, 1, 12, 0, 0)),
-        Bet(bet_id=2, event_id=102, amount=Decimal("50.00"), status=BetStatus.WON, created_at=datetime(2023, 1, 2, 12, 0, 0)),
-        Bet(bet_id=3, event_id=101, amount=Decimal("75.00"), status=BetStatus.LOST, created_at=datetime(2023, 1, 3, 12, 0, 0)),
-        Bet(bet_id=4, event_id=103, amount=Decimal("200.00"), status=BetStatus.PENDING, created_at=datetime(2023, 1, 4, 12, 0, 0)),
-    ]
+def make_bet(**overrides: Any) -> Bet:
+    """
+    Создает Bet из заведомо корректных тестовых данных без валидации Pydantic.
+    Не подходит для тестов, проверяющих валидаторы сущности.
+    """
+    return Bet.model_construct(**{**BET_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def bet_factory() -> Callable[..., Bet]:
+    return make_bet
+
+
+@pytest.fixture(scope="session")
+def sample_bets() -> Tuple[Bet, ...]:
+    return tuple(make_bet(**row) for row in SAMPLE_BET_ROWS)
 
 
 @pytest_asyncio.fixture
 async def populated_db(db_session, sample_bet_models):
     session = db_session
-    for bet_model in sample_bet_models:
-        session.add(bet_model)
+    session.add_all(sample_bet_models)
 
     await session.commit()
     return session
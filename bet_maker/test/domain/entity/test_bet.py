@@ -1,17 +1,35 @@
+import json
+import re
 from datetime import datetime
 from decimal import Decimal
 
 import pytest
+from pydantic_core import ValidationError
 
 from src.domain.entity import Bet
 from src.domain.vo import BetStatus
 
+D_10_50 = Decimal("10.50")
+D_20_00 = Decimal("20.00")
+
+FROZEN_RE = re.compile("frozen_instance")
+
+
+@pytest.fixture(scope="module")
+def base_kwargs():
+    return {"bet_id": 1, "event_id": 123, "amount": D_10_50}
+
+
+@pytest.fixture(scope="module")
+def bet(base_kwargs):
+    return Bet(**base_kwargs)
+
 
 class TestBet:
     def test_bet_creation(self):
         bet_id = 1
         event_id = 123
-        amount = Decimal("10.50")
+        amount = D_10_50
         status = BetStatus.PENDING
         created_at = datetime.now()
         bet = Bet(bet_id=bet_id, event_id=event_id, amount=amount, status=status, created_at=created_at)
@@ -22,55 +40,54 @@ class TestBet:
         assert bet.created_at == created_at
 
     def test_bet_creation_with_string_status(self):
-        bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"), status="PENDING")
+        bet = Bet(bet_id=1, event_id=123, amount=D_10_50, status="PENDING")
         assert bet.status == BetStatus.PENDING
         assert isinstance(bet.status, BetStatus)
 
     def test_bet_creation_with_defaults(self):
-        bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"))
+        bet = Bet(bet_id=1, event_id=123, amount=D_10_50)
         assert bet.status == BetStatus.PENDING
         assert isinstance(bet.created_at, datetime)
 
-    def test_invalid_amount_negative(self):
-        with pytest.raises(ValueError, match="Сумма ставки должна быть положительной"):
-            Bet(bet_id=1, event_id=123, amount=Decimal("-10.50"))
-
-    def test_invalid_amount_zero(self):
-        with pytest.raises(ValueError, match="Сумма ставки должна быть положительной"):
-            Bet(bet_id=1, event_id=123, amount=Decimal("0.00"))
-
-    def test_invalid_amount_decimal_places(self):
-        with pytest.raises(ValueError, match="Сумма ставки должна иметь ровно 2 знака после запятой"):
-            Bet(bet_id=1, event_id=123, amount=Decimal("10.5"))
-        with pytest.raises(ValueError, match="Сумма ставки должна иметь ровно 2 знака после запятой"):
-            Bet(bet_id=1, event_id=123, amount=Decimal("10.555"))
+    @pytest.mark.parametrize(
+        "field,value,match",
+        [
+            ("amount", Decimal("-10.50"), "Сумма ставки должна быть положительной"),
+            ("amount", Decimal("0.00"), "Сумма ставки должна быть положительной"),
+            ("amount", Decimal("10.5"), "Сумма ставки должна иметь ровно 2 знака после запятой"),
+            ("amount", Decimal("10.555"), "Сумма ставки должна иметь ровно 2 знака после запятой"),
+        ],
+    )
+    def test_invalid_bet(self, base_kwargs, field, value, match):
+        with pytest.raises(ValueError, match=match):
+            Bet(**{**base_kwargs, field: value})
 
     def test_invalid_status(self):
         with pytest.raises(ValueError):
-            Bet(bet_id=1, event_id=123, amount=Decimal("10.50"), status="INVALID_STATUS")
+            Bet(bet_id=1, event_id=123, amount=D_10_50, status="INVALID_STATUS")
 
-    def test_is_settled_property(self):
-        pending_bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"), status=BetStatus.PENDING)
-        won_bet = Bet(bet_id=2, event_id=123, amount=Decimal("10.50"), status=BetStatus.WON)
-        lost_bet = Bet(bet_id=3, event_id=123, amount=Decimal("10.50"), status=BetStatus.LOST)
+    def test_is_settled_property(self, bet_factory):
+        pending_bet = bet_factory(bet_id=1, status=BetStatus.PENDING)
+        won_bet = bet_factory(bet_id=2, status=BetStatus.WON)
+        lost_bet = bet_factory(bet_id=3, status=BetStatus.LOST)
         assert not pending_bet.is_settled
         assert won_bet.is_settled
         assert lost_bet.is_settled
 
-    def test_is_winning_property(self):
-        pending_bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"), status=BetStatus.PENDING)
-        won_bet = Bet(bet_id=2, event_id=123, amount=Decimal("10.50"), status=BetStatus.WON)
-        lost_bet = Bet(bet_id=3, event_id=123, amount=Decimal("10.50"), status=BetStatus.LOST)
+    def test_is_winning_property(self, bet_factory):
+        pending_bet = bet_factory(bet_id=1, status=BetStatus.PENDING)
+        won_bet = bet_factory(bet_id=2, status=BetStatus.WON)
+        lost_bet = bet_factory(bet_id=3, status=BetStatus.LOST)
         assert not pending_bet.is_winning
         assert won_bet.is_winning
         assert not lost_bet.is_winning
 
-    def test_formatted_amount(self):
-        bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"))
+    def test_formatted_amount(self, bet_factory):
+        bet = bet_factory(amount=D_10_50)
         assert bet.formatted_amount == "$10.50"
 
-    def test_update_status_from_event_state(self):
-        original_bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"))
+    def test_update_status_from_event_state(self, bet_factory):
+        original_bet = bet_factory()
         updated_bet_win = original_bet.update_status_from_event_state("FINISHED_WIN")
         updated_bet_lose = original_bet.update_status_from_event_state("FINISHED_LOSE")
         updated_bet_new = original_bet.update_status_from_event_state("NEW")
@@ -84,19 +101,19 @@ class TestBet:
         assert updated_bet_win.amount == original_bet.amount
         assert updated_bet_win.created_at == original_bet.created_at
 
-    def test_immutability(self):
-        bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"))
-        with pytest.raises(Exception):
-            bet.status = BetStatus.WON
-        with pytest.raises(Exception):
-            bet.amount = Decimal("20.00")
-
-    def test_json_serialization(self):
-        created_at = datetime(2023, 1, 1, 12, 0, 0)
-        bet = Bet(bet_id=1, event_id=123, amount=Decimal("10.50"), status=BetStatus.PENDING, created_at=created_at)
-        json_str = bet.model_dump_json()
-        assert '"bet_id": 1' in json_str
-        assert '"event_id": 123' in json_str
-        assert '"amount": "10.50"' in json_str
-        assert '"status": "PENDING"' in json_str
-        assert "2023-01-01" in json_str
+    @pytest.mark.parametrize("attr,value", [("status", BetStatus.WON), ("amount", D_20_00)])
+    def test_immutability(self, bet, attr, value):
+        with pytest.raises(ValidationError, match=FROZEN_RE):
+            setattr(bet, attr, value)
+
+    def test_json_serialization(self, bet_factory):
+        bet = bet_factory(event_id=123, amount=D_10_50, created_at=datetime(2023, 1, 1, 12, 0, 0))
+        data = json.loads(bet.model_dump_json())
+
+        assert data == {
+            "bet_id": 1,
+            "event_id": 123,
+            "amount": "10.50",
+            "status": "PENDING",
+            "created_at": "2023-01-01 12:00:00",
+        }
@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+import re
+from datetime import datetime
 from decimal import Decimal
 from unittest.mock import patch
 
@@ -8,28 +9,54 @@ from pydantic_core import ValidationError
 from src.domain.entity import Event
 from src.domain.vo import EventStatus
 
+D_2_50 = Decimal("2.50")
+D_3_00 = Decimal("3.00")
+
+FROZEN_RE = re.compile("frozen_instance")
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+FUTURE_DEADLINE = int(_NOW.timestamp()) + 3600
+FORMATTED_TIMESTAMP = 1609459200
+EXPECTED_FORMATTED_DEADLINE = datetime.fromtimestamp(FORMATTED_TIMESTAMP).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW
+
+
+@pytest.fixture(scope="module")
+def base_kwargs():
+    return {
+        "event_id": 123,
+        "coefficient": D_2_50,
+        "deadline": FUTURE_DEADLINE,
+        "status": EventStatus.NEW,
+    }
+
+
+@pytest.fixture(scope="module")
+def base_event(base_kwargs):
+    return Event(**base_kwargs)
+
 
 class TestEvent:
-    def test_event_creation(self):
-        event_id = 123
-        coefficient = Decimal("2.50")
-        deadline = int(datetime.now().timestamp()) + 3600
-        status = EventStatus.NEW
-        event = Event(
-            event_id=event_id,
-            coefficient=coefficient,
-            deadline=deadline,
-            status=status
-        )
-        assert event.event_id == event_id
-        assert event.coefficient == coefficient
-        assert event.deadline == deadline
-        assert event.status == status
+    @pytest.fixture
+    def frozen_now(self):
+        with patch('src.domain.entity.event.datetime', _FrozenDatetime):
+            yield _NOW
+
+    def test_event_creation(self, base_event):
+        assert base_event.event_id == 123
+        assert base_event.coefficient == D_2_50
+        assert base_event.deadline == FUTURE_DEADLINE
+        assert base_event.status == EventStatus.NEW
 
     def test_event_creation_with_string_status(self):
         event_id = 123
-        coefficient = Decimal("2.50")
-        deadline = int(datetime.now().timestamp()) + 3600
+        coefficient = D_2_50
+        deadline = FUTURE_DEADLINE
         status_str = "NEW"
         event = Event(
             event_id=event_id,
@@ -43,108 +70,46 @@ class TestEvent:
         assert event.status == EventStatus.NEW
         assert isinstance(event.status, EventStatus)
 
-    def test_invalid_coefficient_negative(self):
-        event_id = 123
-        coefficient = Decimal("-2.50")
-        deadline = int(datetime.now().timestamp()) + 3600
-        status = EventStatus.NEW
-        with pytest.raises(ValueError, match="Coefficient must be a positive number"):
-            Event(
-                event_id=event_id,
-                coefficient=coefficient,
-                deadline=deadline,
-                status=status
-            )
-
-    def test_invalid_coefficient_decimal_places(self):
-        event_id = 123
-        coefficient = Decimal("2.5")
-        deadline = int(datetime.now().timestamp()) + 3600
-        status = EventStatus.NEW
-        with pytest.raises(ValueError, match="Coefficient must have exactly 2 decimal places"):
-            Event(
-                event_id=event_id,
-                coefficient=coefficient,
-                deadline=deadline,
-                status=status
-            )
-
-    def test_invalid_status(self):
-        event_id = 123
-        coefficient = Decimal("2.50")
-        deadline = int(datetime.now().timestamp()) + 3600
-        status = "INVALID_STATUS"
-        with pytest.raises(ValidationError):
-            Event(
-                event_id=event_id,
-                coefficient=coefficient,
-                deadline=deadline,
-                status=status
-            )
-
-    @patch('src.domain.entity.event.datetime')
-    def test_is_active_property_active(self, mock_datetime):
-        now = datetime.now()
-        mock_datetime.now.return_value = now
-        future_deadline = int((now + timedelta(hours=1)).timestamp())
-        event = Event(
-            event_id=123,
-            coefficient=Decimal("2.50"),
-            deadline=future_deadline,
-            status=EventStatus.NEW
-        )
-        assert event.is_active is True
-
-    @patch('src.domain.entity.event.datetime')
-    def test_is_active_property_inactive_deadline_passed(self, mock_datetime):
-        now = datetime.now()
-        mock_datetime.now.return_value = now
-        past_deadline = int((now - timedelta(hours=1)).timestamp())
-        event = Event(
-            event_id=123,
-            coefficient=Decimal("2.50"),
-            deadline=past_deadline,
-            status=EventStatus.NEW
-        )
-        assert event.is_active is False
+    @pytest.mark.parametrize(
+        "field,value,match",
+        [
+            ("coefficient", Decimal("-2.50"), "Коэффициент должен быть положительным числом"),
+            ("coefficient", Decimal("2.5"), "Коэффициент должен иметь ровно 2 знака после запятой"),
+            ("status", "INVALID_STATUS", "status"),
+        ],
+    )
+    def test_invalid_event(self, base_kwargs, field, value, match):
+        with pytest.raises(ValidationError, match=match):
+            Event(**{**base_kwargs, field: value})
 
-    @patch('src.domain.entity.event.datetime')
-    def test_is_active_property_inactive_finished_status(self, mock_datetime):
-        now = datetime.now()
-        mock_datetime.now.return_value = now
-        future_deadline = int((now + timedelta(hours=1)).timestamp())
-        event = Event(
-            event_id=123,
-            coefficient=Decimal("2.50"),
-            deadline=future_deadline,
-            status=EventStatus.FINISHED_WIN
-        )
-        assert event.is_active is False
+    @pytest.mark.usefixtures("frozen_now")
+    @pytest.mark.parametrize(
+        "delta_hours,status,expected",
+        [
+            (1, EventStatus.NEW, True),
+            (-1, EventStatus.NEW, False),
+            (1, EventStatus.FINISHED_WIN, False),
+        ],
+        ids=["active", "deadline_passed", "finished_status"],
+    )
+    def test_is_active_property(self, base_event, delta_hours, status, expected):
+        deadline = int(_NOW.timestamp()) + delta_hours * 3600
+        event = base_event.model_copy(update={"deadline": deadline, "status": status})
+        assert event.is_active is expected
 
-    def test_formatted_deadline(self):
-        timestamp = 1609459200
-        event = Event(
-            event_id=123,
-            coefficient=Decimal("2.50"),
-            deadline=timestamp,
-            status=EventStatus.NEW
-        )
-        formatted = event.formatted_deadline
-        expected = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-        assert formatted == expected
+    def test_formatted_deadline(self, base_event):
+        event = base_event.model_copy(update={"deadline": FORMATTED_TIMESTAMP})
+        assert event.formatted_deadline == EXPECTED_FORMATTED_DEADLINE
 
-    def test_immutability(self):
-        event = Event(
-            event_id=123,
-            coefficient=Decimal("2.50"),
-            deadline=int(datetime.now().timestamp()) + 3600,
-            status=EventStatus.NEW
-        )
-        with pytest.raises(ValidationError, match="frozen_instance"):
-            event.event_id = 456
-        with pytest.raises(ValidationError, match="frozen_instance"):
-            event.coefficient = Decimal("3.00")
-        with pytest.raises(ValidationError, match="frozen_instance"):
-            event.deadline = int(datetime.now().timestamp()) + 7200
-        with pytest.raises(ValidationError, match="frozen_instance"):
-            event.status = EventStatus.FINISHED_WIN
+    @pytest.mark.parametrize(
+        "attr,value",
+        [
+            ("event_id", 456),
+            ("coefficient", D_3_00),
+            ("deadline", FUTURE_DEADLINE + 3600),
+            ("status", EventStatus.FINISHED_WIN),
+        ],
+    )
+    def test_immutability(self, base_event, attr, value):
+        with pytest.raises(ValidationError, match=FROZEN_RE):
+            setattr(base_event, attr, value)
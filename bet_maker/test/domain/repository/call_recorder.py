@@ -0,0 +1,19 @@
+from typing import Any
+
+
+class CallRecorder:
+    __slots__ = ("call_count", "call_args", "call_kwargs")
+
+    def __init__(self):
+        self.call_count = 0
+        self.call_args = None
+        self.call_kwargs = None
+
+    @property
+    def called(self) -> bool:
+        return self.call_count > 0
+
+    def record(self, *args: Any, **kwargs: Any) -> None:
+        self.call_count += 1
+        self.call_args = args
+        self.call_kwargs = kwargs
@@ -1,94 +1,120 @@
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Dict, Any, Optional, Union
-from unittest.mock import AsyncMock
+from typing import List, Dict, Iterable, Optional, Set, Tuple, Union
 
 import pytest
+from pydantic import TypeAdapter
 
 from src.domain.entity import Bet
 from src.domain.repository import BaseBetRepository
 from src.domain.vo import BetStatus
 from src.exception import BetNotFoundError
 
-pytestmark = pytest.mark.asyncio
+from .call_recorder import CallRecorder
+
+D_10_00 = Decimal("10.00")
+D_20_00 = Decimal("20.00")
+D_30_00 = Decimal("30.00")
+D_40_00 = Decimal("40.00")
+D_50_00 = Decimal("50.00")
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+ONE_HOUR_AGO = NOW - timedelta(hours=1)
+ONE_DAY_AGO = NOW - timedelta(days=1)
+
+BET_LIST_ADAPTER = TypeAdapter(Tuple[Bet, ...])
 
 
 class MockBetRepository(BaseBetRepository):
-    def __init__(self, bets: List[Dict[str, Any]] = None):
-        self.bets = {}
-        self.next_id = 1
-        if bets:
-            for bet_data in bets:
-                bet = Bet.model_validate(bet_data)
-                self.bets[bet.bet_id] = bet
-                if isinstance(bet.bet_id, int) and bet.bet_id >= self.next_id:
-                    self.next_id = bet.bet_id + 1
-        self.get_all_mock = AsyncMock(side_effect=self._get_all)
-        self.get_by_id_mock = AsyncMock(side_effect=self._get_by_id)
-        self.create_mock = AsyncMock(side_effect=self._create)
-        self.get_by_event_id_mock = AsyncMock(side_effect=self._get_by_event_id)
-        self.get_by_status_mock = AsyncMock(side_effect=self._get_by_status)
-        self.update_status_mock = AsyncMock(side_effect=self._update_status)
-        self.filter_bets_mock = AsyncMock(side_effect=self._filter_bets)
-        self.exists_mock = AsyncMock(side_effect=self._exists)
+    __slots__ = (
+        "bets", "next_id", "_by_event", "_by_status", "_by_created",
+        "get_all_mock", "get_by_id_mock", "create_mock", "get_by_event_id_mock",
+        "get_by_status_mock", "update_status_mock", "filter_bets_mock", "exists_mock",
+    )
+
+    def __init__(self, bets: Iterable[Bet] = ()):
+        self.bets: Dict[int, Bet] = {}
+        self._by_event: Dict[int, Set[int]] = defaultdict(set)
+        self._by_status: Dict[BetStatus, Dict[int, Bet]] = {status: {} for status in BetStatus}
+        self._by_created: List[Tuple[datetime, int]] = []
+        for bet in bets:
+            self._store(bet)
+        self.next_id = max(self.bets, default=0) + 1
+        self.reset_calls()
+
+    def reset_calls(self) -> None:
+        self.get_all_mock = CallRecorder()
+        self.get_by_id_mock = CallRecorder()
+        self.create_mock = CallRecorder()
+        self.get_by_event_id_mock = CallRecorder()
+        self.get_by_status_mock = CallRecorder()
+        self.update_status_mock = CallRecorder()
+        self.filter_bets_mock = CallRecorder()
+        self.exists_mock = CallRecorder()
+
+    def clone(self) -> "MockBetRepository":
+        repository = MockBetRepository.__new__(MockBetRepository)
+        repository.bets = dict(self.bets)
+        repository._by_event = defaultdict(set, {key: set(ids) for key, ids in self._by_event.items()})
+        repository._by_status = {status: dict(bets) for status, bets in self._by_status.items()}
+        repository._by_created = list(self._by_created)
+        repository.next_id = self.next_id
+        repository.reset_calls()
+        return repository
+
+    def _store(self, bet: Bet) -> None:
+        previous = self.bets.get(bet.bet_id)
+        if previous is not None:
+            self._by_event[previous.event_id].discard(bet.bet_id)
+            del self._by_status[previous.status][bet.bet_id]
+            if previous.created_at != bet.created_at:
+                self._by_created.remove((previous.created_at, bet.bet_id))
+                insort(self._by_created, (bet.created_at, bet.bet_id))
+        else:
+            insort(self._by_created, (bet.created_at, bet.bet_id))
+        self.bets[bet.bet_id] = bet
+        self._by_event[bet.event_id].add(bet.bet_id)
+        self._by_status[bet.status][bet.bet_id] = bet
+
+    def _collect(self, bet_ids: Iterable[int]) -> List[Bet]:
+        return [self.bets[bet_id] for bet_id in sorted(bet_ids)]
 
     async def get_all(self) -> List[Bet]:
-        return await self.get_all_mock()
-
-    async def _get_all(self) -> List[Bet]:
+        self.get_all_mock.record()
         return list(self.bets.values())
 
     async def get_by_id(self, bet_id: Union[int, str]) -> Bet:
-        return await self.get_by_id_mock(bet_id)
-
-    async def _get_by_id(self, bet_id: Union[int, str]) -> Bet:
+        self.get_by_id_mock.record(bet_id)
         if bet_id not in self.bets:
             raise BetNotFoundError(bet_id)
         return self.bets[bet_id]
 
     async def create(self, bet: Bet) -> Bet:
-        return await self.create_mock(bet)
-
-    async def _create(self, bet: Bet) -> Bet:
+        self.create_mock.record(bet)
         new_bet_id = self.next_id
         self.next_id += 1
-        new_bet = Bet.model_validate({
-            "bet_id": new_bet_id,
-            "event_id": bet.event_id,
-            "amount": bet.amount,
-            "status": bet.status,
-            "created_at": bet.created_at
-        })
-        self.bets[new_bet_id] = new_bet
+        new_bet = bet.model_copy(update={"bet_id": new_bet_id})
+        self._store(new_bet)
         return new_bet
 
     async def get_by_event_id(self, event_id: Union[int, str]) -> List[Bet]:
-        return await self.get_by_event_id_mock(event_id)
-
-    async def _get_by_event_id(self, event_id: Union[int, str]) -> List[Bet]:
-        return [bet for bet in self.bets.values() if bet.event_id == event_id]
+        self.get_by_event_id_mock.record(event_id)
+        return self._collect(self._by_event.get(event_id, ()))
 
     async def get_by_status(self, status: BetStatus) -> List[Bet]:
-        return await self.get_by_status_mock(status)
-
-    async def _get_by_status(self, status: BetStatus) -> List[Bet]:
-        return [bet for bet in self.bets.values() if bet.status == status]
+        self.get_by_status_mock.record(status)
+        return list(self._by_status[status].values())
 
     async def update_status(self, bet_id: Union[int, str], new_status: BetStatus) -> Bet:
-        return await self.update_status_mock(bet_id, new_status)
-
-    async def _update_status(self, bet_id: Union[int, str], new_status: BetStatus) -> Bet:
+        self.update_status_mock.record(bet_id, new_status)
         if bet_id not in self.bets:
             raise BetNotFoundError(bet_id)
         existing_bet = self.bets[bet_id]
-        updated_bet = Bet.model_validate({
-            "bet_id": existing_bet.bet_id,
-            "event_id": existing_bet.event_id,
-            "amount": existing_bet.amount,
-            "status": new_status,
-            "created_at": existing_bet.created_at
-        })
-        self.bets[bet_id] = updated_bet
+        updated_bet = existing_bet.model_copy(update={"status": new_status})
+        self._store(updated_bet)
         return updated_bet
 
     async def filter_bets(
@@ -98,79 +124,88 @@ class MockBetRepository(BaseBetRepository):
         created_after: Optional[datetime] = None,
         created_before: Optional[datetime] = None,
     ) -> List[Bet]:
-        return await self.filter_bets_mock(event_id, status, created_after, created_before)
-
-    async def _filter_bets(
-        self,
-        event_id: Optional[Union[int, str]] = None,
-        status: Optional[BetStatus] = None,
-        created_after: Optional[datetime] = None,
-        created_before: Optional[datetime] = None,
-    ) -> List[Bet]:
-        result = list(self.bets.values())
+        self.filter_bets_mock.record(
+            event_id=event_id, status=status, created_after=created_after, created_before=created_before
+        )
+        bet_ids: Optional[Set[int]] = None
         if event_id is not None:
-            result = [bet for bet in result if bet.event_id == event_id]
+            bet_ids = self._by_event.get(event_id, set())
         if status is not None:
-            result = [bet for bet in result if bet.status == status]
-        if created_after is not None:
-            result = [bet for bet in result if bet.created_at > created_after]
-        if created_before is not None:
-            result = [bet for bet in result if bet.created_at < created_before]
-        return result
+            by_status = self._by_status[status].keys()
+            bet_ids = set(by_status) if bet_ids is None else bet_ids & by_status
+        if created_after is not None or created_before is not None:
+            lo = 0 if created_after is None else bisect_right(
+                self._by_created, created_after, key=lambda entry: entry[0]
+            )
+            hi = len(self._by_created) if created_before is None else bisect_left(
+                self._by_created, created_before, key=lambda entry: entry[0]
+            )
+            in_range = {bet_id for _, bet_id in self._by_created[lo:hi]}
+            bet_ids = in_range if bet_ids is None else bet_ids & in_range
+        if bet_ids is None:
+            return list(self.bets.values())
+        return self._collect(bet_ids)
 
     async def exists(self, bet_id: Union[int, str]) -> bool:
-        return await self.exists_mock(bet_id)
-
-    async def _exists(self, bet_id: Union[int, str]) -> bool:
+        self.exists_mock.record(bet_id)
         return bet_id in self.bets
 
 
+SAMPLE_BETS = BET_LIST_ADAPTER.validate_python([
+    {"bet_id": 1, "event_id": 101, "amount": D_10_00, "status": BetStatus.PENDING, "created_at": NOW},
+    {"bet_id": 2, "event_id": 101, "amount": D_20_00, "status": BetStatus.WON, "created_at": NOW - timedelta(hours=2)},
+    {"bet_id": 3, "event_id": 102, "amount": D_30_00, "status": BetStatus.LOST, "created_at": NOW - timedelta(hours=2)},
+    {"bet_id": 4, "event_id": 103, "amount": D_40_00, "status": BetStatus.PENDING, "created_at": ONE_DAY_AGO},
+])
+EXPECTED_IDS_BY_STATUS = {
+    status: frozenset(bet.bet_id for bet in SAMPLE_BETS if bet.status == status)
+    for status in BetStatus
+}
+
+
+@pytest.fixture(scope="module")
+def shared_repository():
+    return MockBetRepository(SAMPLE_BETS)
+
+
 @pytest.fixture
-def sample_bets():
-    now = datetime.now()
-    earlier = now - timedelta(hours=1)
-    much_earlier = now - timedelta(days=1)
-    return [
-        {"bet_id": 1, "event_id": 101, "amount": Decimal("10.00"), "status": BetStatus.PENDING, "created_at": now},
-        {"bet_id": 2, "event_id": 101, "amount": Decimal("20.00"), "status": BetStatus.WON, "created_at": earlier},
-        {"bet_id": 3, "event_id": 102, "amount": Decimal("30.00"), "status": BetStatus.LOST, "created_at": earlier},
-        {"bet_id": 4, "event_id": 103, "amount": Decimal("40.00"), "status": BetStatus.PENDING, "created_at": much_earlier}
-    ]
+def mock_repository(shared_repository):
+    return shared_repository.clone()
 
 
 @pytest.fixture
-def mock_repository(sample_bets):
-    return MockBetRepository(sample_bets)
+def ro_repository(shared_repository):
+    shared_repository.reset_calls()
+    return shared_repository
 
 
 class TestBaseBetRepository:
-    async def test_get_all(self, mock_repository, sample_bets):
-        bets = await mock_repository.get_all()
-        assert len(bets) == len(sample_bets)
-        assert mock_repository.get_all_mock.called
+    async def test_get_all(self, ro_repository):
+        bets = await ro_repository.get_all()
+        assert len(bets) == len(SAMPLE_BETS)
+        assert ro_repository.get_all_mock.called
 
-    async def test_get_by_id_existing(self, mock_repository):
-        bet = await mock_repository.get_by_id(1)
+    async def test_get_by_id_existing(self, ro_repository):
+        bet = await ro_repository.get_by_id(1)
         assert bet.bet_id == 1
-        assert bet.amount == Decimal("10.00")
+        assert bet.amount == D_10_00
         assert bet.status == BetStatus.PENDING
-        assert mock_repository.get_by_id_mock.called
+        assert ro_repository.get_by_id_mock.called
 
-    async def test_get_by_id_nonexistent(self, mock_repository):
+    async def test_get_by_id_nonexistent(self, ro_repository):
         with pytest.raises(BetNotFoundError) as exc_info:
-            await mock_repository.get_by_id(999)
+            await ro_repository.get_by_id(999)
         assert "999" in str(exc_info.value)
-        assert mock_repository.get_by_id_mock.called
+        assert ro_repository.get_by_id_mock.called
 
     async def test_create(self, mock_repository):
         next_expected_id = mock_repository.next_id
-        now = datetime.now()
         bet_data = {
             "bet_id": 999,
             "event_id": 105,
-            "amount": Decimal("50.00"),
+            "amount": D_50_00,
             "status": BetStatus.PENDING,
-            "created_at": now
+            "created_at": NOW
         }
         new_bet = Bet.model_validate(bet_data)
         initial_count = len(await mock_repository.get_all())
@@ -179,30 +214,29 @@ class TestBaseBetRepository:
         assert created_bet.bet_id != 999
         assert created_bet.bet_id == next_expected_id
         assert created_bet.event_id == 105
-        assert created_bet.amount == Decimal("50.00")
+        assert created_bet.amount == D_50_00
         assert mock_repository.create_mock.called
         stored_bet = await mock_repository.get_by_id(created_bet.bet_id)
         assert stored_bet == created_bet
         final_count = len(await mock_repository.get_all())
         assert final_count == initial_count + 1
 
-    async def test_get_by_event_id(self, mock_repository):
-        event_bets = await mock_repository.get_by_event_id(101)
+    async def test_get_by_event_id(self, ro_repository):
+        event_bets = await ro_repository.get_by_event_id(101)
         assert len(event_bets) == 2
         assert all(bet.event_id == 101 for bet in event_bets)
-        assert mock_repository.get_by_event_id_mock.called
-
-    async def test_get_by_status(self, mock_repository):
-        pending_bets = await mock_repository.get_by_status(BetStatus.PENDING)
-        won_bets = await mock_repository.get_by_status(BetStatus.WON)
-        lost_bets = await mock_repository.get_by_status(BetStatus.LOST)
-        assert len(pending_bets) == 2
-        assert all(bet.status == BetStatus.PENDING for bet in pending_bets)
-        assert len(won_bets) == 1
-        assert all(bet.status == BetStatus.WON for bet in won_bets)
-        assert len(lost_bets) == 1
-        assert all(bet.status == BetStatus.LOST for bet in lost_bets)
-        assert mock_repository.get_by_status_mock.call_count == 3
+        assert ro_repository.get_by_event_id_mock.called
+
+    async def test_get_by_status(self, ro_repository):
+        pending_bets, won_bets, lost_bets = await asyncio.gather(
+            ro_repository.get_by_status(BetStatus.PENDING),
+            ro_repository.get_by_status(BetStatus.WON),
+            ro_repository.get_by_status(BetStatus.LOST),
+        )
+        assert frozenset(bet.bet_id for bet in pending_bets) == EXPECTED_IDS_BY_STATUS[BetStatus.PENDING]
+        assert frozenset(bet.bet_id for bet in won_bets) == EXPECTED_IDS_BY_STATUS[BetStatus.WON]
+        assert frozenset(bet.bet_id for bet in lost_bets) == EXPECTED_IDS_BY_STATUS[BetStatus.LOST]
+        assert ro_repository.get_by_status_mock.call_count == 3
 
     async def test_update_status(self, mock_repository):
         updated_bet = await mock_repository.update_status(1, BetStatus.WON)
@@ -218,49 +252,44 @@ class TestBaseBetRepository:
         assert "999" in str(exc_info.value)
         assert mock_repository.update_status_mock.called
 
-    async def test_filter_bets_by_event_id(self, mock_repository):
-        filtered_bets = await mock_repository.filter_bets(event_id=101)
+    async def test_filter_bets_by_event_id(self, ro_repository):
+        filtered_bets = await ro_repository.filter_bets(event_id=101)
         assert len(filtered_bets) == 2
         assert all(bet.event_id == 101 for bet in filtered_bets)
-        assert mock_repository.filter_bets_mock.called
-        assert mock_repository.filter_bets_mock.call_args[0][0] == 101
+        assert ro_repository.filter_bets_mock.called
+        assert ro_repository.filter_bets_mock.call_kwargs["event_id"] == 101
+
+    async def test_filter_bets_by_status(self, ro_repository):
+        filtered_bets = await ro_repository.filter_bets(status=BetStatus.PENDING)
+        assert frozenset(bet.bet_id for bet in filtered_bets) == EXPECTED_IDS_BY_STATUS[BetStatus.PENDING]
+        assert ro_repository.filter_bets_mock.called
+        assert ro_repository.filter_bets_mock.call_kwargs["status"] == BetStatus.PENDING
+
+    async def test_filter_bets_by_created_timeframe(self, ro_repository):
+        recent_bets, older_bets = await asyncio.gather(
+            ro_repository.filter_bets(created_after=ONE_HOUR_AGO),
+            ro_repository.filter_bets(created_after=ONE_DAY_AGO, created_before=ONE_HOUR_AGO),
+        )
+        assert [bet.bet_id for bet in recent_bets] == [1]
+        assert [bet.bet_id for bet in older_bets] == [2, 3]
+        assert ro_repository.filter_bets_mock.call_count == 2
 
-    async def test_filter_bets_by_status(self, mock_repository):
-        filtered_bets = await mock_repository.filter_bets(status=BetStatus.PENDING)
-        assert len(filtered_bets) == 2
-        assert all(bet.status == BetStatus.PENDING for bet in filtered_bets)
-        assert mock_repository.filter_bets_mock.called
-        assert mock_repository.filter_bets_mock.call_args[0][1] == BetStatus.PENDING
-
-    async def test_filter_bets_by_created_timeframe(self, mock_repository, sample_bets):
-        now = datetime.now()
-        one_hour_ago = now - timedelta(hours=1)
-        one_day_ago = now - timedelta(days=1)
-        recent_bets = await mock_repository.filter_bets(created_after=one_hour_ago)
-        older_bets = await mock_repository.filter_bets(created_after=one_day_ago, created_before=one_hour_ago)
-        assert len(recent_bets) >= 1
-        assert len(older_bets) >= 1
-        assert all(bet.created_at > one_hour_ago for bet in recent_bets)
-        assert all(one_day_ago < bet.created_at < one_hour_ago for bet in older_bets)
-        assert mock_repository.filter_bets_mock.call_count == 2
-
-    async def test_filter_bets_combined_criteria(self, mock_repository):
-        now = datetime.now()
-        one_hour_ago = now - timedelta(hours=1)
-        filtered_bets = await mock_repository.filter_bets(
+    async def test_filter_bets_combined_criteria(self, ro_repository):
+        filtered_bets = await ro_repository.filter_bets(
             event_id=101,
             status=BetStatus.PENDING,
-            created_after=one_hour_ago
+            created_after=ONE_HOUR_AGO
         )
         assert all(
             bet.event_id == 101 and
             bet.status == BetStatus.PENDING and
-            bet.created_at > one_hour_ago
+            bet.created_at > ONE_HOUR_AGO
             for bet in filtered_bets
         )
-        assert mock_repository.filter_bets_mock.called
+        assert ro_repository.filter_bets_mock.called
 
-    async def test_exists(self, mock_repository):
-        assert await mock_repository.exists(1) is True
-        assert await mock_repository.exists(999) is False
-        assert mock_repository.exists_mock.call_count == 2
+    async def test_exists(self, ro_repository):
+        existing, missing = await asyncio.gather(ro_repository.exists(1), ro_repository.exists(999))
+        assert existing is True
+        assert missing is False
+        assert ro_repository.exists_mock.call_count == 2
@@ -1,111 +1,119 @@
-from datetime import datetime, timedelta
+import asyncio
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Dict, Any, Optional, Union
-from unittest.mock import AsyncMock
+from typing import Dict, List, Iterable, Optional, Tuple, Union
 
 import pytest
+from pydantic import TypeAdapter
 
 from src.domain.entity import Event
 from src.domain.repository import BaseEventRepository
 from src.domain.vo import EventStatus
 from src.exception import EventNotFoundError
 
-pytestmark = pytest.mark.asyncio
+from .call_recorder import CallRecorder
+
+D_1_50 = Decimal("1.50")
+D_2_00 = Decimal("2.00")
+D_3_00 = Decimal("3.00")
+D_4_00 = Decimal("4.00")
+
+NOW_TS = int(time.time())
+NOW = datetime.fromtimestamp(NOW_TS)
+
+EVENT_LIST_ADAPTER = TypeAdapter(Tuple[Event, ...])
 
 
 class MockEventRepository(BaseEventRepository):
-    def __init__(self, events: List[Dict[str, Any]] = None):
-        self.events = {}
-        if events:
-            for event_data in events:
-                event = Event.model_validate(event_data)
-                self.events[event.event_id] = event
-        self.get_all_mock = AsyncMock(side_effect=self._get_all)
-        self.get_by_id_mock = AsyncMock(side_effect=self._get_by_id)
-        self.get_active_events_mock = AsyncMock(side_effect=self._get_active_events)
-        self.filter_events_mock = AsyncMock(side_effect=self._filter_events)
-        self.exists_mock = AsyncMock(side_effect=self._exists)
+    __slots__ = (
+        "events", "_by_status", "_active", "_by_deadline", "_deadlines",
+        "get_all_mock", "get_by_id_mock", "get_active_events_mock", "filter_events_mock", "exists_mock",
+    )
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self.events = {event.event_id: event for event in events}
+        self._by_status: Dict[EventStatus, List[Event]] = defaultdict(list)
+        for event in self.events.values():
+            self._by_status[event.status].append(event)
+        self._active = [event for event in self.events.values() if event.status.is_active]
+        self._by_deadline = sorted(self.events.values(), key=lambda event: event.deadline)
+        self._deadlines = [event.deadline for event in self._by_deadline]
+        self.reset_calls()
+
+    def reset_calls(self) -> None:
+        self.get_all_mock = CallRecorder()
+        self.get_by_id_mock = CallRecorder()
+        self.get_active_events_mock = CallRecorder()
+        self.filter_events_mock = CallRecorder()
+        self.exists_mock = CallRecorder()
 
     async def get_all(self) -> List[Event]:
-        return await self.get_all_mock()
-
-    async def _get_all(self) -> List[Event]:
+        self.get_all_mock.record()
         return list(self.events.values())
 
     async def get_by_id(self, event_id: Union[int, str]) -> Event:
-        return await self.get_by_id_mock(event_id)
-
-    async def _get_by_id(self, event_id: Union[int, str]) -> Event:
+        self.get_by_id_mock.record(event_id)
         if event_id not in self.events:
             raise EventNotFoundError(event_id)
         return self.events[event_id]
 
     async def get_active_events(self) -> List[Event]:
-        return await self.get_active_events_mock()
-
-    async def _get_active_events(self) -> List[Event]:
-        current_time = int(datetime.now().timestamp())
-        return [
-            event for event in self.events.values()
-            if event.status.is_active and event.deadline > current_time
-        ]
+        self.get_active_events_mock.record()
+        current_time = int(time.time())
+        return [event for event in self._active if event.deadline > current_time]
 
     async def filter_events(self,
                             status: Optional[EventStatus] = None,
                             before_deadline: Optional[datetime] = None,
                             after_deadline: Optional[datetime] = None) -> List[Event]:
-        return await self.filter_events_mock(status, before_deadline, after_deadline)
-
-    async def _filter_events(self,
-                             status: Optional[EventStatus] = None,
-                             before_deadline: Optional[datetime] = None,
-                             after_deadline: Optional[datetime] = None) -> List[Event]:
-        result = list(self.events.values())
+        self.filter_events_mock.record(status, before_deadline, after_deadline)
+        if not before_deadline and not after_deadline:
+            return list(self._by_status.get(status, [])) if status else list(self.events.values())
+        lo = bisect_right(self._deadlines, int(after_deadline.timestamp())) if after_deadline else 0
+        hi = bisect_left(self._deadlines, int(before_deadline.timestamp())) if before_deadline else len(self._deadlines)
+        window = self._by_deadline[lo:hi]
         if status:
-            result = [event for event in result if event.status == status]
-        if before_deadline:
-            before_timestamp = int(before_deadline.timestamp())
-            result = [event for event in result if event.deadline < before_timestamp]
-        if after_deadline:
-            after_timestamp = int(after_deadline.timestamp())
-            result = [event for event in result if event.deadline > after_timestamp]
-        return result
+            return [event for event in window if event.status == status]
+        return window
 
     async def exists(self, event_id: Union[int, str]) -> bool:
-        return await self.exists_mock(event_id)
-
-    async def _exists(self, event_id: Union[int, str]) -> bool:
+        self.exists_mock.record(event_id)
         return event_id in self.events
 
 
-@pytest.fixture
-def sample_events():
-    now = datetime.now()
-    future = now + timedelta(days=1)
-    past = now - timedelta(days=1)
-    return [
-        Event(event_id=1, coefficient=Decimal("1.50"), deadline=int(future.timestamp()), status=EventStatus.NEW),
-        Event(event_id=2, coefficient=Decimal("2.00"), deadline=int(past.timestamp()), status=EventStatus.NEW),
-        Event(event_id=3, coefficient=Decimal("3.00"), deadline=int(future.timestamp()), status=EventStatus.FINISHED_WIN),
-        Event(event_id=4, coefficient=Decimal("4.00"), deadline=int(future.timestamp()), status=EventStatus.FINISHED_LOSE)
-    ]
+FUTURE_DEADLINE = NOW_TS + 86400
+PAST_DEADLINE = NOW_TS - 86400
+SAMPLE_EVENTS = EVENT_LIST_ADAPTER.validate_python([
+    {"event_id": 1, "coefficient": D_1_50, "deadline": FUTURE_DEADLINE, "status": EventStatus.NEW},
+    {"event_id": 2, "coefficient": D_2_00, "deadline": PAST_DEADLINE, "status": EventStatus.NEW},
+    {"event_id": 3, "coefficient": D_3_00, "deadline": FUTURE_DEADLINE, "status": EventStatus.FINISHED_WIN},
+    {"event_id": 4, "coefficient": D_4_00, "deadline": FUTURE_DEADLINE, "status": EventStatus.FINISHED_LOSE},
+])
+
+
+@pytest.fixture(scope="module")
+def mock_repository():
+    return MockEventRepository(SAMPLE_EVENTS)
 
 
-@pytest.fixture
-def mock_repository(sample_events):
-    return MockEventRepository(sample_events)
+@pytest.fixture(autouse=True)
+def reset_repository_calls(mock_repository):
+    mock_repository.reset_calls()
 
 
 class TestBaseEventRepository:
-    async def test_get_all(self, mock_repository, sample_events):
+    async def test_get_all(self, mock_repository):
         events = await mock_repository.get_all()
-        assert len(events) == len(sample_events)
+        assert len(events) == len(SAMPLE_EVENTS)
         assert mock_repository.get_all_mock.called
 
     async def test_get_by_id_existing(self, mock_repository):
         event = await mock_repository.get_by_id(1)
         assert event.event_id == 1
-        assert event.coefficient == Decimal("1.50")
+        assert event.coefficient == D_1_50
         assert mock_repository.get_by_id_mock.called
 
     async def test_get_by_id_nonexistent(self, mock_repository):
@@ -121,17 +129,20 @@ class TestBaseEventRepository:
         assert mock_repository.get_active_events_mock.called
 
     async def test_filter_events_by_status(self, mock_repository):
-        new_events = await mock_repository.filter_events(status=EventStatus.NEW)
-        finished_win_events = await mock_repository.filter_events(status=EventStatus.FINISHED_WIN)
+        new_events, finished_win_events = await asyncio.gather(
+            mock_repository.filter_events(status=EventStatus.NEW),
+            mock_repository.filter_events(status=EventStatus.FINISHED_WIN),
+        )
         assert len(new_events) == 2
         assert all(e.status == EventStatus.NEW for e in new_events)
         assert len(finished_win_events) == 1
         assert finished_win_events[0].event_id == 3
 
     async def test_filter_events_by_deadline(self, mock_repository):
-        now = datetime.now()
-        future_events = await mock_repository.filter_events(after_deadline=now)
-        past_events = await mock_repository.filter_events(before_deadline=now)
+        future_events, past_events = await asyncio.gather(
+            mock_repository.filter_events(after_deadline=NOW),
+            mock_repository.filter_events(before_deadline=NOW),
+        )
         assert len(future_events) == 3
         assert all(e.event_id in [1, 3, 4] for e in future_events)
         assert len(past_events) == 1
@@ -139,6 +150,7 @@ class TestBaseEventRepository:
         assert mock_repository.filter_events_mock.call_count == 2
 
     async def test_exists(self, mock_repository):
-        assert await mock_repository.exists(1) is True
-        assert await mock_repository.exists(999) is False
+        existing, missing = await asyncio.gather(mock_repository.exists(1), mock_repository.exists(999))
+        assert existing is True
+        assert missing is False
         assert mock_repository.exists_mock.call_count == 2
\ No newline at end of file
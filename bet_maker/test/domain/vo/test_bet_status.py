@@ -1,23 +1,25 @@
+import importlib
+import inspect
+
 import pytest
 
 from src.domain.vo import BetStatus
 
 
 class TestBetStatus:
-    def test_enum_values(self):
-        assert BetStatus.PENDING == "PENDING"
-        assert BetStatus.WON == "WON"
-        assert BetStatus.LOST == "LOST"
-
-    def test_string_representation(self):
-        assert str(BetStatus.PENDING) == "PENDING"
-        assert str(BetStatus.WON) == "WON"
-        assert str(BetStatus.LOST) == "LOST"
-
-    def test_enum_comparison(self):
-        assert BetStatus.PENDING is BetStatus("PENDING")
-        assert BetStatus.WON is BetStatus("WON")
-        assert BetStatus.LOST is BetStatus("LOST")
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (BetStatus.PENDING, "PENDING"),
+            (BetStatus.WON, "WON"),
+            (BetStatus.LOST, "LOST"),
+        ],
+    )
+    def test_member_value(self, member, value):
+        assert member == value
+        assert str(member) == value
+        assert member.__str__() == value
+        assert member is BetStatus(value)
 
     def test_value_uniqueness(self):
         values = [status.value for status in BetStatus]
@@ -32,24 +34,20 @@ class TestBetStatus:
         with pytest.raises(AttributeError):
             BetStatus.PENDING = "MODIFIED"
 
-    @pytest.mark.parametrize(
-        "event_state,expected_status",
-        [
+    def test_from_event_state(self):
+        cases = [
             ("NEW", BetStatus.PENDING),
             ("UNKNOWN", BetStatus.PENDING),
             ("FINISHED_WIN", BetStatus.WON),
             ("FINISHED_LOSE", BetStatus.LOST),
             (None, BetStatus.PENDING),
             ("", BetStatus.PENDING),
-        ],
-    )
-    def test_from_event_state(self, event_state, expected_status):
-        assert BetStatus.from_event_state(event_state) is expected_status
+        ]
+        for event_state, expected_status in cases:
+            assert BetStatus.from_event_state(event_state) is expected_status, (event_state, expected_status)
 
     def test_classmethod_binding(self):
         assert hasattr(BetStatus, 'from_event_state')
-
-        import inspect
         assert isinstance(inspect.getattr_static(BetStatus, 'from_event_state'), classmethod)
 
         result = BetStatus.from_event_state("FINISHED_WIN")
@@ -63,7 +61,6 @@ class TestBetStatus:
         assert BetStatus.WON in statuses
         assert BetStatus.LOST in statuses
 
-    def test_str_dunder_method(self):
-        assert BetStatus.PENDING.__str__() == "PENDING"
-        assert BetStatus.WON.__str__() == "WON"
-        assert BetStatus.LOST.__str__() == "LOST"
+    @pytest.mark.parametrize("module_path", ["src.domain.vo", "src.domain.vo.bet_status"])
+    def test_import_paths(self, module_path):
+        assert importlib.import_module(module_path).BetStatus is BetStatus
@@ -1,23 +1,24 @@
+import importlib
+
 import pytest
 
 from src.domain.vo import EventStatus
 
 
 class TestEventStatus:
-    def test_enum_values(self):
-        assert EventStatus.NEW == "NEW"
-        assert EventStatus.FINISHED_WIN == "FINISHED_WIN"
-        assert EventStatus.FINISHED_LOSE == "FINISHED_LOSE"
-
-    def test_string_representation(self):
-        assert str(EventStatus.NEW) == "NEW"
-        assert str(EventStatus.FINISHED_WIN) == "FINISHED_WIN"
-        assert str(EventStatus.FINISHED_LOSE) == "FINISHED_LOSE"
-
-    def test_enum_comparison(self):
-        assert EventStatus.NEW is EventStatus("NEW")
-        assert EventStatus.FINISHED_WIN is EventStatus("FINISHED_WIN")
-        assert EventStatus.FINISHED_LOSE is EventStatus("FINISHED_LOSE")
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (EventStatus.NEW, "NEW"),
+            (EventStatus.FINISHED_WIN, "FINISHED_WIN"),
+            (EventStatus.FINISHED_LOSE, "FINISHED_LOSE"),
+        ],
+    )
+    def test_member_value(self, member, value):
+        assert member == value
+        assert str(member) == value
+        assert member.__str__() == value
+        assert member is EventStatus(value)
 
     def test_value_uniqueness(self):
         values = [status.value for status in EventStatus]
@@ -50,3 +51,7 @@ class TestEventStatus:
         assert EventStatus.NEW.is_finished is False
         assert EventStatus.FINISHED_WIN.is_finished is True
         assert EventStatus.FINISHED_LOSE.is_finished is True
+
+    @pytest.mark.parametrize("module_path", ["src.domain.vo", "src.domain.vo.event_status"])
+    def test_import_paths(self, module_path):
+        assert importlib.import_module(module_path).EventStatus is EventStatus
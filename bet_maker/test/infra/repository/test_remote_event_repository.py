@@ -1,43 +1,62 @@
+import json
+import time
+from pathlib import Path
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock
 from datetime import datetime
 from decimal import Decimal
 
-from httpx import HTTPStatusError, Response
+from httpx import HTTPStatusError, Request, Response
 
 from src.domain.entity import Event
 from src.domain.vo import EventStatus
-from src.infra.http.http_client import HTTPClient
+from src.infra.http import HTTPClient
 from src.infra.repository import RemoteEventRepository
 from src.exception import EventNotFoundError, EventRepositoryConnectionError
 
-pytestmark = pytest.mark.asyncio
+NOW_TS = int(time.time())
+NOW = datetime.fromtimestamp(NOW_TS)
+
+CASSETTE_PATH = Path(__file__).parent / "cassettes" / "line_provider.json"
+
+
+class _StubHTTPClient:
+    __slots__ = ("get", "get_json", "get_model", "get_model_list")
+
+    def __init__(self):
+        self.get = AsyncMock()
+        self.get_json = AsyncMock()
+        self.get_model = AsyncMock()
+        self.get_model_list = AsyncMock()
+
+    def reset(self):
+        for mock in (self.get, self.get_json, self.get_model, self.get_model_list):
+            mock.reset_mock(return_value=True, side_effect=True)
 
 
 class TestRemoteEventRepository:
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_http_client(self):
-        client = MagicMock(spec=HTTPClient)
-        client.get = AsyncMock()
-        client.get_json = AsyncMock()
-        client.get_model = AsyncMock()
-        client.get_model_list = AsyncMock()
-        return client
-
-    @pytest.fixture
+        return _StubHTTPClient()
+
+    @pytest.fixture(scope="class")
     def repository(self, mock_http_client):
         return RemoteEventRepository(http_client=mock_http_client)
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def reset_http_client(self, mock_http_client):
+        yield
+        mock_http_client.reset()
+
+    @pytest.fixture(scope="class")
     def sample_events(self):
-        now = datetime.now()
-        now_timestamp = int(now.timestamp())
-        
         return [
-            Event(event_id=1, coefficient=Decimal("1.50"), deadline=now_timestamp + 86400, status=EventStatus.NEW),
-            Event(event_id=2, coefficient=Decimal("1.75"), deadline=now_timestamp - 86400, status=EventStatus.FINISHED_WIN),
-            Event(event_id=3, coefficient=Decimal("1.25"), deadline=now_timestamp + 172800, status=EventStatus.NEW)
+            Event(event_id=1, coefficient=Decimal("1.50"), deadline=NOW_TS + 86400, status=EventStatus.NEW),
+            Event(event_id=2, coefficient=Decimal("1.75"), deadline=NOW_TS - 86400, status=EventStatus.FINISHED_WIN),
+            Event(event_id=3, coefficient=Decimal("1.25"), deadline=NOW_TS + 172800, status=EventStatus.NEW)
         ]
 
     async def test_get_all_success(self, repository, mock_http_client, sample_events):
@@ -66,10 +85,8 @@ class TestRemoteEventRepository:
         mock_http_client.get_model.assert_called_once_with("/api/v1/event/1", Event)
 
     async def test_get_by_id_not_found(self, repository, mock_http_client):
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 404
-        
-        http_error = HTTPStatusError("Event not found", request=MagicMock(), response=mock_response)
+        request = Request("GET", "http://line-provider/api/v1/event/999")
+        http_error = HTTPStatusError("Event not found", request=request, response=Response(404, request=request))
         
         mock_http_client.get_model.side_effect = http_error
         
@@ -93,36 +110,24 @@ class TestRemoteEventRepository:
         
         active_events = await repository.get_active_events()
         
-        now_timestamp = int(datetime.now().timestamp())
-        expected_events = [event for event in sample_events 
-                           if event.status == EventStatus.NEW and event.deadline > now_timestamp]
-        
-        assert len(active_events) == len(expected_events)
-        assert all(event in expected_events for event in active_events)
+        assert [event.event_id for event in active_events] == [1, 3]
         mock_http_client.get_model_list.assert_called_once()
 
-    async def test_filter_events_by_status(self, repository, mock_http_client, sample_events):
+    @pytest.mark.parametrize(
+        "kwargs, expected_ids",
+        [
+            ({"status": EventStatus.NEW}, [1, 3]),
+            ({"deadline_after": NOW}, [1, 3]),
+            ({"deadline_before": NOW}, [2]),
+        ],
+        ids=["by_status", "by_deadline_after", "by_deadline_before"],
+    )
+    async def test_filter_events(self, repository, mock_http_client, sample_events, kwargs, expected_ids):
         mock_http_client.get_model_list.return_value = sample_events
         
-        filtered_events = await repository.filter_events(status=EventStatus.NEW)
+        filtered_events = await repository.filter_events(**kwargs)
         
-        expected_events = [event for event in sample_events if event.status == EventStatus.NEW]
-        
-        assert len(filtered_events) == len(expected_events)
-        assert all(event in expected_events for event in filtered_events)
-        mock_http_client.get_model_list.assert_called_once()
-
-    async def test_filter_events_by_deadline(self, repository, mock_http_client, sample_events):
-        mock_http_client.get_model_list.return_value = sample_events
-        now = datetime.now()
-        now_timestamp = int(now.timestamp())
-        
-        filtered_events = await repository.filter_events(deadline_after=now)
-        
-        expected_events = [event for event in sample_events if event.deadline > now_timestamp]
-        
-        assert len(filtered_events) == len(expected_events)
-        assert all(event in expected_events for event in filtered_events)
+        assert [event.event_id for event in filtered_events] == expected_ids
         mock_http_client.get_model_list.assert_called_once()
 
     async def test_exists_true(self, repository, mock_http_client, sample_events):
@@ -134,10 +139,8 @@ class TestRemoteEventRepository:
         mock_http_client.get_model.assert_called_once()
 
     async def test_exists_false(self, repository, mock_http_client):
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 404
-        
-        http_error = HTTPStatusError("Event not found", request=MagicMock(), response=mock_response)
+        request = Request("GET", "http://line-provider/api/v1/event/999")
+        http_error = HTTPStatusError("Event not found", request=request, response=Response(404, request=request))
         
         mock_http_client.get_model.side_effect = http_error
         
@@ -145,3 +148,64 @@ class TestRemoteEventRepository:
         
         assert exists is False
         mock_http_client.get_model.assert_called_once()
+
+
+class _CassetteReplay:
+    __slots__ = ("interactions",)
+
+    def __init__(self, path: Path):
+        self.interactions = json.loads(path.read_text(encoding="utf-8"))
+
+    def handle(self, request):
+        key = f"{request.method} {request.url.path}"
+        if key not in self.interactions:
+            raise AssertionError(f"Запрос {key} отсутствует в кассете {CASSETTE_PATH.name}")
+        interaction = self.interactions[key]
+        return httpx.Response(interaction["status_code"], json=interaction["json"])
+
+
+class TestRemoteEventRepositoryReplay:
+
+    @pytest.fixture(scope="class")
+    def cassette(self):
+        cassette = _CassetteReplay(CASSETTE_PATH)
+        transport = httpx.MockTransport(cassette.handle)
+
+        class _ReplayAsyncClient(httpx.AsyncClient):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, transport=transport, **kwargs)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(httpx, "AsyncClient", _ReplayAsyncClient)
+            yield cassette
+
+    @pytest.fixture(scope="class")
+    def repository(self, cassette):
+        return RemoteEventRepository(http_client=HTTPClient(base_url="http://line-provider"))
+
+    async def test_get_all(self, repository):
+        events = await repository.get_all()
+
+        assert [event.event_id for event in events] == [1, 2, 3]
+        assert events[1].coefficient == Decimal("1.75")
+        assert events[1].status == EventStatus.FINISHED_WIN
+
+    async def test_get_by_id(self, repository):
+        event = await repository.get_by_id(1)
+
+        assert event == Event(event_id=1, coefficient=Decimal("1.50"), deadline=4102444800, status=EventStatus.NEW)
+
+    async def test_get_by_id_not_found(self, repository):
+        with pytest.raises(EventNotFoundError) as exc_info:
+            await repository.get_by_id(999)
+
+        assert "999" in str(exc_info.value)
+
+    async def test_exists(self, repository):
+        assert await repository.exists(1) is True
+        assert await repository.exists(999) is False
+
+    async def test_get_active_events(self, repository):
+        events = await repository.get_active_events(limit=10, offset=0)
+
+        assert [event.event_id for event in events] == [1, 3]
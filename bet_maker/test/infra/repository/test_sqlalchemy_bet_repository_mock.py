@@ -1,37 +1,36 @@
 import pytest
 from decimal import Decimal
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.infra.repository import SQLAlchemyBetRepository
+from src.infra.repository.sqlalchemy_bet_repository import EXISTS_STMT, GET_BY_ID_STMT
 from src.domain.entity import BetRequest, BetResponse
 from src.domain.vo import BetStatus
 from src.exception import BetNotFoundError, BetCreationError
 
 
-class AsyncMockResult:
-    def __init__(self, return_value):
-        self.return_value = return_value
-    
-    def scalars(self):
-        return self
+def _result(value):
+    result = SimpleNamespace()
+    result.scalars = lambda: result
+    result.all = result.scalar_one = result.scalar_one_or_none = result.scalar = lambda: value
+    return result
 
-    def all(self):
-        return self.return_value
-    
-    def scalar_one(self):
-        return self.return_value
-    
-    def scalar_one_or_none(self):
-        return self.return_value
 
+@pytest.fixture
+def mock_session():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.refresh = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
 
-@pytest.mark.asyncio
-async def test_get_all_bets(sample_bet_models):
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(sample_bet_models)
-    mock_session.execute = AsyncMock(return_value=mock_result)
+
+async def test_get_all_bets(sample_bet_models, mock_session):
+    mock_session.execute.return_value = _result(sample_bet_models)
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
@@ -43,24 +42,19 @@ async def test_get_all_bets(sample_bet_models):
         assert bet.amount == model.amount
 
 
-@pytest.mark.asyncio
-async def test_get_bet_by_id(sample_bet_models):
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(sample_bet_models[0])
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_get_bet_by_id(sample_bet_models, mock_session):
+    mock_session.execute.return_value = _result(sample_bet_models[0])
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
     bet = await repository.get_by_id(sample_bet_models[0].bet_id)
 
     assert bet.bet_id == sample_bet_models[0].bet_id
+    mock_session.execute.assert_awaited_once_with(GET_BY_ID_STMT, {"bet_id": sample_bet_models[0].bet_id})
 
 
-@pytest.mark.asyncio
-async def test_get_by_id_not_found():
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(None)
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_get_by_id_not_found(mock_session):
+    mock_session.execute.return_value = _result(None)
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
@@ -68,28 +62,22 @@ async def test_get_by_id_not_found():
         await repository.get_by_id(9999)
 
 
-@pytest.mark.asyncio
-async def test_create_bet(sample_bets):
-    mock_session = MagicMock()
-    mock_session.commit = AsyncMock()
-    mock_session.refresh = AsyncMock()
+async def test_create_bet(sample_bets, mock_session):
+    mock_session.execute.return_value = _result(MagicMock())
     
     with patch.object(SQLAlchemyBetRepository, '_to_domain_entity', return_value=sample_bets[0]):
         repository = SQLAlchemyBetRepository(session=mock_session)
 
         created_bet = await repository.create(sample_bets[0])
 
-        mock_session.add.assert_called_once()
+        mock_session.execute.assert_awaited_once()
         mock_session.commit.assert_awaited_once()
-        mock_session.refresh.assert_awaited_once()
+        mock_session.add.assert_not_called()
         assert created_bet.bet_id == sample_bets[0].bet_id
 
 
-@pytest.mark.asyncio
-async def test_create_bet_raises_creation_error(sample_bets):
-    mock_session = MagicMock()
-    mock_session.add = MagicMock(side_effect=SQLAlchemyError("DB error"))
-    mock_session.rollback = AsyncMock()
+async def test_create_bet_raises_creation_error(sample_bets, mock_session):
+    mock_session.execute.side_effect = SQLAlchemyError("DB error")
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
@@ -99,31 +87,20 @@ async def test_create_bet_raises_creation_error(sample_bets):
     mock_session.rollback.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_update_bet_status(sample_bet_models):
-    mock_session = MagicMock()
-    first_result = AsyncMockResult(sample_bet_models[0])
-    update_result = AsyncMockResult(None)
-    third_result = AsyncMockResult(sample_bet_models[0])
-    
-    mock_session.execute = AsyncMock()
-    mock_session.execute.side_effect = [first_result, update_result, third_result]
-    mock_session.commit = AsyncMock()
+async def test_update_bet_status(sample_bet_models, mock_session):
+    mock_session.execute.return_value = _result(sample_bet_models[0])
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
     updated_bet = await repository.update_status(sample_bet_models[0].bet_id, BetStatus.WON)
 
     assert updated_bet is not None
-    assert mock_session.execute.await_count == 3
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_update_status_bet_not_found():
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(None)
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_update_status_bet_not_found(mock_session):
+    mock_session.execute.return_value = _result(None)
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
@@ -131,11 +108,8 @@ async def test_update_status_bet_not_found():
         await repository.update_status(9999, BetStatus.WON)
 
 
-@pytest.mark.asyncio
-async def test_filter_bets(sample_bet_models):
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(sample_bet_models)
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_filter_bets(sample_bet_models, mock_session):
+    mock_session.execute.return_value = _result(sample_bet_models)
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
@@ -145,25 +119,19 @@ async def test_filter_bets(sample_bet_models):
     mock_session.execute.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_exists_bet(sample_bet_models):
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(sample_bet_models[0])
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_exists_bet(sample_bet_models, mock_session):
+    mock_session.execute.return_value = _result(True)
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
     exists = await repository.exists(sample_bet_models[0].bet_id)
 
     assert exists
-    mock_session.execute.assert_awaited_once()
+    mock_session.execute.assert_awaited_once_with(EXISTS_STMT, {"bet_id": sample_bet_models[0].bet_id})
 
 
-@pytest.mark.asyncio
-async def test_exists_bet_not_found():
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(None)
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_exists_bet_not_found(mock_session):
+    mock_session.execute.return_value = _result(False)
     
     repository = SQLAlchemyBetRepository(session=mock_session)
 
@@ -173,27 +141,18 @@ async def test_exists_bet_not_found():
     mock_session.execute.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_update_bets(sample_bets):
-    mock_session = MagicMock()
-    mock_session.execute = AsyncMock()
-    mock_session.commit = AsyncMock()
-    
+async def test_update_bets(sample_bets, mock_session):
+    mock_session.execute.return_value = _result([bet.bet_id for bet in sample_bets])
     repository = SQLAlchemyBetRepository(session=mock_session)
     
     await repository.update_bets(sample_bets)
     
-    assert mock_session.execute.await_count == len(sample_bets)
+    assert mock_session.execute.await_count == 2
+    assert len(mock_session.execute.await_args.args[1]) == len(sample_bets)
     mock_session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_save():
-    mock_session = MagicMock()
-    mock_session.add = MagicMock()
-    mock_session.commit = AsyncMock()
-    mock_session.refresh = AsyncMock()
-    
+async def test_save(mock_session):
     repository = SQLAlchemyBetRepository(session=mock_session)
     
     bet_request = BetRequest(
@@ -218,12 +177,9 @@ async def test_save():
     mock_session.refresh.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_get_pending_bets(sample_bet_models):
-    mock_session = MagicMock()
+async def test_get_pending_bets(sample_bet_models, mock_session):
     pending_models = [m for m in sample_bet_models if m.status == BetStatus.PENDING]
-    mock_result = AsyncMockResult(pending_models)
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = _result(pending_models)
     
     repository = SQLAlchemyBetRepository(session=mock_session)
     
@@ -243,11 +199,8 @@ async def test_get_pending_bets(sample_bet_models):
     mock_session.execute.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_get_all_bets_with_limit(sample_bet_models):
-    mock_session = MagicMock()
-    mock_result = AsyncMockResult(sample_bet_models[:2])  
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_get_all_bets_with_limit(sample_bet_models, mock_session):
+    mock_session.execute.return_value = _result(sample_bet_models[:2])
     
     repository = SQLAlchemyBetRepository(session=mock_session)
     
@@ -262,4 +215,4 @@ async def test_get_all_bets_with_limit(sample_bet_models):
         bets = await repository.get_all_bets(limit=2)
     
     assert len(bets) == 2
-    mock_session.execute.assert_awaited_once()
\ No newline at end of file
+    mock_session.execute.assert_awaited_once()
@@ -94,14 +94,16 @@ class EventService:
             EventNotFoundError: Если событие с указанным ID не найдено
             ValueError: Если событие уже завершено
         """
-        event = await self.repository.get_by_id(event_id)
-        if event.is_finished:
-            raise ValueError(f"Событие {event_id} уже завершено")
-
         new_status = EventStatus.FINISHED_WIN if first_team_won else EventStatus.FINISHED_LOSE
-        event.status = new_status
 
-        return await self.repository.update(event)  # TODO: Implement
+        event = await self.repository.finish(event_id, new_status)
+        if event is None:
+            # Событие не изменено: get_by_id выбросит EventNotFoundError, если его нет,
+            # иначе событие уже было завершено
+            await self.repository.get_by_id(event_id)
+            raise ValueError(f"Событие {event_id} уже завершено")
+
+        return event
 
     async def event_exists(self, event_id: int) -> bool:
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from src.domain.entity import Event
 from src.domain.vo import EventStatus
@@ -90,6 +90,23 @@ class BaseEventRepository(ABC):
             EventNotFoundError: Если событие с указанным ID не найдено
         """
 
+    @abstractmethod
+    async def finish(self, event_id: int, new_status: EventStatus) -> Optional[Event]:
+        """
+        Завершение события одной условной операцией.
+
+        Статус меняется, только если событие существует и ещё не завершено;
+        проверка и изменение выполняются атомарно, без отдельного чтения.
+
+        Args:
+            event_id: ID события для завершения
+            new_status: Итоговый статус события
+
+        Returns:
+            Optional[Event]: Обновленное событие или None, если событие
+                не найдено либо уже завершено
+        """
+
     @abstractmethod
     async def exists(self, event_id: int) -> bool:
         """
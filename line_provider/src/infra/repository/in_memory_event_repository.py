@@ -118,6 +118,28 @@ class InMemoryEventRepository(BaseEventRepository):
         event.status = new_status
         return event
 
+    async def finish(self, event_id: int, new_status: EventStatus) -> Optional[Event]:
+        """
+        Завершает событие, если оно существует и ещё не завершено.
+
+        Проверка и смена статуса выполняются без промежуточных await, поэтому
+        конкурентные вызовы не могут завершить одно событие дважды.
+
+        Args:
+            event_id: ID события для завершения
+            new_status: Итоговый статус события
+
+        Returns:
+            Optional[Event]: Обновленное событие или None, если событие
+                не найдено либо уже завершено
+        """
+        event: Optional[Event] = self._events.get(event_id)
+        if event is None or event.is_finished:
+            return None
+
+        event.status = new_status
+        return event
+
     async def exists(self, event_id: int) -> bool:
         """
         Проверяет существование события в репозитории.
@@ -131,52 +131,35 @@ class TestEventService:
 
     async def test_finish_event_win(self, event_service, mock_repository, sample_event):
         event_id = sample_event.event_id
-        unfinished_event = Event(
-            event_id=event_id,
-            coefficient=sample_event.coefficient,
-            deadline=sample_event.deadline,
-            status=EventStatus.NEW
-        )
-        mock_repository.get_by_id.return_value = unfinished_event
         expected_event = Event(
             event_id=event_id,
             coefficient=sample_event.coefficient,
             deadline=sample_event.deadline,
             status=EventStatus.FINISHED_WIN
         )
-        mock_repository.update.return_value = expected_event
+        mock_repository.finish.return_value = expected_event
         updated_event = await event_service.finish_event(event_id, first_team_won=True)
         assert updated_event == expected_event
-        mock_repository.get_by_id.assert_awaited_once_with(event_id)
-        mock_repository.update.assert_awaited_once()
-        updated_arg = mock_repository.update.call_args[0][0]
-        assert updated_arg.status == EventStatus.FINISHED_WIN
+        mock_repository.finish.assert_awaited_once_with(event_id, EventStatus.FINISHED_WIN)
+        mock_repository.get_by_id.assert_not_awaited()
+        mock_repository.update.assert_not_awaited()
 
     async def test_finish_event_lose(self, event_service, mock_repository, sample_event):
         event_id = sample_event.event_id
-        unfinished_event = Event(
-            event_id=event_id,
-            coefficient=sample_event.coefficient,
-            deadline=sample_event.deadline,
-            status=EventStatus.NEW
-        )
-        mock_repository.get_by_id.return_value = unfinished_event
-
         expected_event = Event(
             event_id=event_id,
             coefficient=sample_event.coefficient,
             deadline=sample_event.deadline,
             status=EventStatus.FINISHED_LOSE
         )
-        mock_repository.update.return_value = expected_event
+        mock_repository.finish.return_value = expected_event
 
         updated_event = await event_service.finish_event(event_id, first_team_won=False)
 
         assert updated_event == expected_event
-        mock_repository.get_by_id.assert_awaited_once_with(event_id)
-        mock_repository.update.assert_awaited_once()
-        updated_arg = mock_repository.update.call_args[0][0]
-        assert updated_arg.status == EventStatus.FINISHED_LOSE
+        mock_repository.finish.assert_awaited_once_with(event_id, EventStatus.FINISHED_LOSE)
+        mock_repository.get_by_id.assert_not_awaited()
+        mock_repository.update.assert_not_awaited()
 
     async def test_finish_event_already_finished(self, event_service, mock_repository, sample_event):
         event_id = sample_event.event_id
@@ -186,13 +169,25 @@ class TestEventService:
             deadline=sample_event.deadline,
             status=EventStatus.FINISHED_WIN
         )
+        mock_repository.finish.return_value = None
         mock_repository.get_by_id.return_value = finished_event
 
         with pytest.raises(ValueError, match=f"Событие {event_id} уже завершено"):
             await event_service.finish_event(event_id, first_team_won=True)
+        mock_repository.finish.assert_awaited_once_with(event_id, EventStatus.FINISHED_WIN)
         mock_repository.get_by_id.assert_awaited_once_with(event_id)
         mock_repository.update.assert_not_awaited()
 
+    async def test_finish_event_not_found(self, event_service, mock_repository):
+        event_id = 999
+        mock_repository.finish.return_value = None
+        mock_repository.get_by_id.side_effect = EventNotFoundError(event_id)
+
+        with pytest.raises(EventNotFoundError) as exc_info:
+            await event_service.finish_event(event_id, first_team_won=True)
+        assert exc_info.value.event_id == event_id
+        mock_repository.get_by_id.assert_awaited_once_with(event_id)
+
     async def test_event_exists(self, event_service, mock_repository):
         event_id = 1
         mock_repository.exists.return_value = True
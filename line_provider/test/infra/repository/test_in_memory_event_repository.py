@@ -180,6 +180,18 @@ class TestInMemoryEventRepo:
             await repository.update_status(999, EventStatus.FINISHED_WIN)
         assert exc_info.value.event_id == 999
 
+    async def test_finish(self, populated_repo: InMemoryEventRepository):
+        event = await populated_repo.finish(1, EventStatus.FINISHED_LOSE)
+        assert event.status == EventStatus.FINISHED_LOSE
+        retrieved_event = await populated_repo.get_by_id(1)
+        assert retrieved_event.status == EventStatus.FINISHED_LOSE
+
+        assert await populated_repo.finish(1, EventStatus.FINISHED_WIN) is None
+        assert (await populated_repo.get_by_id(1)).status == EventStatus.FINISHED_LOSE
+
+    async def test_finish_non_existing(self, repository: InMemoryEventRepository):
+        assert await repository.finish(999, EventStatus.FINISHED_WIN) is None
+
     async def test_exists_existing(self, populated_repo: InMemoryEventRepository):
         assert await populated_repo.exists(1)
 